@@ -11,6 +11,8 @@ Downloads movie posters from user's diary entries.
 import requests
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 from letterboxdpy import user
 from letterboxdpy.core.scraper import parse_url
@@ -18,9 +20,10 @@ from letterboxdpy.utils.utils_terminal import get_input, args_exists
 
 
 class Settings:
-    def __init__(self, foldering=True, size_check=False):
+    def __init__(self, foldering=True, size_check=False, workers=8):
         self.foldering = foldering # Create folders for each day
         self.size_check = size_check  # Check if file size already exists
+        self.workers = workers  # Number of posters downloaded concurrently
 
 class Path:
     @staticmethod
@@ -52,12 +55,30 @@ class App:
 
         self.foldering = self.config.foldering
         self.size_check = self.config.size_check
+        self.workers = self.config.workers
 
-    def get_poster_url(self, slug):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def get_poster_url(slug):
+        # Rewatches log the same film more than once, so only look it up once.
         poster_ajax = f"https://letterboxd.com/ajax/poster/film/{slug}/std/500x750/"
         poster_page = parse_url(poster_ajax)
         return poster_page.img['srcset'].split('?')[0]
 
+    def download_poster(self, count, slug, file_path):
+        poster_url = self.get_poster_url(slug)
+        response = requests.get(poster_url)
+        response.raise_for_status()
+
+        if os.path.exists(file_path):
+            if os.stat(file_path).st_size == len(response.content):
+                print(f'{count} - File already exists and has same size as new file, skipping..')
+                return
+            print(f'Rewriting {file_path}..')
+
+        Path.save(file_path, response.content)
+        print(f'{count} - Wrote {file_path}')
+
     def run(self):
         count = self.data['count']
         entries = self.data['entries']
@@ -81,6 +102,8 @@ class App:
             Path.check_path(years_dir)
             previous_year = None
 
+        jobs = []
+        queued = set()
         for v in entries.values():
             date = v["date"]
 
@@ -97,6 +120,12 @@ class App:
             else:
                 file_path = os.path.join(self.USER_POSTERS_DIR, file_dated_name)
 
+            # same film logged twice on one day, two workers must not write the same file
+            if file_path in queued:
+                print(f'{count} - Poster for {v["slug"]} on {file_date} is already queued, skipping..')
+                count -= 1
+                continue
+
             if os.path.exists(file_path):
                 if not self.size_check:
                     if not already_start:
@@ -110,21 +139,26 @@ class App:
                 print(f'Have already processed {already_start - count} entries, skipping {count}..')
                 already_start = 0
 
-            poster_url = self.get_poster_url(v['slug'])
-            response = requests.get(poster_url)
-
-            if os.path.exists(file_path):
-                if int(os.stat(file_path).st_size) == int(response.headers['Content-Length']):
-                    print(f'{count} - File already exists and has same size as new file, skipping..')
-                    count -= 1
-                    continue
-                print(f'Rewriting {file_path}..')
-
-            Path.save(file_path, response.content)
-            print(f'{count} - Wrote {file_path}')
+            jobs.append((count, v['slug'], file_path))
+            queued.add(file_path)
             count -= 1
 
-        print('Processing complete!')
+        # Poster lookups are network-bound, so overlap them across entries.
+        failed = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.download_poster, *job): job for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    job_count, slug, _ = futures[future]
+                    print(f'{job_count} - Failed to download poster for {slug}: {e}')
+                    failed += 1
+
+        if failed:
+            print(f'Processing finished with {failed} failed entries.')
+        else:
+            print('Processing complete!')
         click_url = 'file:///' + os.path.join(os.getcwd(), self.USER_POSTERS_DIR).replace("\\", "/")
         print('At', click_url)
 
@@ -2,8 +2,13 @@ if __name__ == '__main__':
     import sys
     sys.path.append(sys.path[0] + '/..')
 
+from email.utils import parsedate_to_datetime
 from json import dumps as json_dumps
+import threading
+import time
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import requests
 
 from letterboxdpy.constants.project import DOMAIN
@@ -14,13 +19,37 @@ from letterboxdpy.core.exceptions import (
 )
 
 class Scraper:
-    """A class for scraping and parsing web pages."""
+    """
+    A class for scraping and parsing web pages.
+
+    All requests share one session and are paced process-wide to at most
+    ``max_requests_per_second``; set it to ``None`` to disable pacing.
+    Rate-limited (429) responses are retried up to ``max_rate_limit_retries``
+    times, waiting for the server's Retry-After. If it asks for more than
+    ``retry_after_max`` seconds the 429 is not retried and raises
+    InvalidResponseError like any other error response.
+    """
 
     headers = {
         "referer": DOMAIN,
         "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
     }
     builder = "lxml"
+    max_requests_per_second = 8
+    max_rate_limit_retries = 3
+    retry_after_max = 60
+
+    # Shared session so every fetch reuses pooled keep-alive connections.
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        # 429s are handled by _fetch, so the adapter must not sleep on Retry-After
+        max_retries=Retry(total=3, backoff_factor=0.3, respect_retry_after_header=False)
+    ))
+    _rate_lock = threading.Lock()
+    _next_request_at = 0.0
 
     def __init__(self, domain: str = headers['referer'], user_agent: str = headers["user-agent"]):
         """Initialize the scraper with the specified domain and user-agent."""
@@ -39,10 +68,44 @@ class Scraper:
     @classmethod
     def _fetch(cls, url: str) -> requests.Response:
         """Fetch the HTML content from the specified URL."""
+        for attempt in range(cls.max_rate_limit_retries + 1):
+            cls._throttle()
+            try:
+                response = cls.session.get(url)
+            except requests.RequestException as e:
+                raise PageLoadError(url, str(e))
+
+            if response.status_code != 429 or attempt == cls.max_rate_limit_retries:
+                return response
+
+            wait = cls._get_retry_after(response, default=0.3 * 2 ** attempt)
+            if wait > cls.retry_after_max:
+                # too long to wait, left to _check_for_errors
+                return response
+            time.sleep(wait)
+
+    @staticmethod
+    def _get_retry_after(response: requests.Response, default: float) -> float:
+        """Return the Retry-After delay in seconds, or the default if absent or malformed."""
+        retry_after = response.headers.get("Retry-After", "").strip()
+        if retry_after.isdigit():
+            return float(retry_after)
         try:
-            return requests.get(url, headers=cls.headers)
-        except requests.RequestException as e:
-            raise PageLoadError(url, str(e))
+            return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError, IndexError):
+            return default
+
+    @classmethod
+    def _throttle(cls) -> None:
+        """Space out requests shared across threads to stay under the rate limit."""
+        if not cls.max_requests_per_second:
+            return
+        with cls._rate_lock:
+            now = time.monotonic()
+            wait = cls._next_request_at - now
+            cls._next_request_at = max(now, cls._next_request_at) + 1 / cls.max_requests_per_second
+        if wait > 0:
+            time.sleep(wait)
 
     @classmethod
     def _check_for_errors(cls, url: str, response: requests.Response) -> None:
@@ -5,6 +5,9 @@ if __loader__.name == '__main__':
 import re
 import os
 import csv
+from itertools import chain
+from operator import itemgetter
+from typing import Iterator
 from json import (
     dumps as json_dumps,
     loads as json_loads
@@ -15,6 +18,8 @@ from letterboxdpy.pages import user_diary
 from letterboxdpy.core.exceptions import PrivateRouteError
 
 
+USERNAME_PATTERN = re.compile(r"^[A-Za-z0-9_]+$")
+
 
 class Diary:
 
@@ -23,7 +28,7 @@ class Diary:
             self.diary = user_diary.UserDiary(username)
 
     def __init__(self, username: str) -> None:
-        assert re.match("^[A-Za-z0-9_]+$", username), "Invalid author"
+        assert USERNAME_PATTERN.match(username), "Invalid author"
         self.username = username
         self.pages = self.DiaryPages(self.username)
         self.url = self.get_url()
@@ -48,6 +53,58 @@ class Diary:
         return self.pages.diary.url
     def get_entries(self) -> dict:
         return self.pages.diary.get_diary()
+    def iter_entries(self) -> Iterator[dict]:
+        """Yield diary entries page by page without keeping the whole diary in memory.
+
+        Entries are deduplicated by log id, like the merged dict of get_entries().
+        """
+        seen = set()
+        for _, entries in self.pages.diary.iter_diary_pages():
+            for log_id, entry in entries.items():
+                if log_id not in seen:
+                    seen.add(log_id)
+                    yield entry
+
+
+CSV_FIELDNAMES = ["name", "slug", "id", "release", "runtime", "rewatched", "rating", "liked", "reviewed", "date"]
+
+
+def flag(value) -> str:
+    """CSV form of an action flag: '1'/'0', or an empty cell when it is missing."""
+    if value is True or value is False:
+        return '1' if value else '0'
+    return '' if value is None else str(value)
+
+
+def diary_row(entry: dict) -> dict:
+    """Flatten a diary entry into the CSV fields as plain strings."""
+    actions = entry.get('actions', {}) if isinstance(entry.get('actions', {}), dict) else {}
+    date_obj = entry.get('date', {}) if isinstance(entry.get('date', {}), dict) else {}
+    # format date as YYYY-MM-DD if possible
+    if date_obj and all(k in date_obj and date_obj[k] is not None for k in ('year', 'month', 'day')):
+        try:
+            date_str = f"{int(date_obj['year']):04d}-{int(date_obj['month']):02d}-{int(date_obj['day']):02d}"
+        except Exception:
+            date_str = str(date_obj)
+    else:
+        date_str = str(date_obj) if date_obj else ''
+
+    row = {
+        'name': entry.get('name', '') or '',
+        'slug': entry.get('slug', '') or '',
+        'id': entry.get('id', '') or '',
+        'release': entry.get('release', '') or '',
+        'runtime': entry.get('runtime', '') or '',
+        'rating': actions.get('rating', ''),
+        'date': date_str,
+    }
+    # Ensure all values are simple scalars for CSV
+    row = {k: '' if v is None else str(v) for k, v in row.items()}
+    # the flags are booleans, written as 1/0 rather than True/False
+    row['rewatched'] = flag(actions.get('rewatched'))
+    row['liked'] = flag(actions.get('liked'))
+    row['reviewed'] = flag(actions.get('reviewed'))
+    return row
 
 
 if __name__ == "__main__":
@@ -59,6 +116,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Fetch a user's diary.")
     parser.add_argument('--user', '-u', help="Username to fetch diary for", required=False)
     parser.add_argument('--debug', action='store_true', help='Print debug info about first diary entry')
+    parser.add_argument('--format', '-f', choices=['csv', 'parquet', 'feather'], default='csv',
+                        help="Output file format (parquet/feather need the 'export' extra: pandas and pyarrow)")
     args = parser.parse_args()
 
     username = args.user or input('Enter username: ').strip()
@@ -71,91 +130,55 @@ if __name__ == "__main__":
     try:
         diary_instance = Diary(username)
         print('URL:', diary_instance.url)
-        entries = diary_instance.entries
+        # entries are streamed page by page, peek at the first one to see if there are any
+        entries = diary_instance.iter_entries()
+        first_entry = next(entries, None)
         if args.debug:
             # print a short debug summary of the first entry
-            sample = None
-            if isinstance(entries, dict) and 'entries' in entries:
-                vals = list(entries['entries'].values())
-                sample = vals[0] if vals else None
-            elif isinstance(entries, dict):
-                vals = [v for v in entries.values() if isinstance(v, dict)]
-                sample = vals[0] if vals else None
-            elif isinstance(entries, list):
-                sample = entries[0] if entries else None
-            print('DEBUG sample entry:', sample)
-        entries = diary_instance.entries
-        if entries:
+            print('DEBUG sample entry:', first_entry)
+        if first_entry is not None:
+            entries = chain([first_entry], entries)
             output_dir = os.path.join(os.path.dirname(__file__), 'output_csv')
             os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.join(output_dir, f'diary_{username}.csv')
-
-            # Normalize structure
-            if isinstance(entries, dict):
-                # Case 1: {'entries': {id: entry, ...}, 'count': N, ...}
-                if 'entries' in entries and isinstance(entries['entries'], dict):
-                    entries_list = list(entries['entries'].values())
-                # Case 2: dict of entries keyed by id: {id: entry, ...}
-                elif all(isinstance(v, dict) for v in entries.values()):
-                    entries_list = list(entries.values())
-                else:
-                    # fallback: look for lists inside values
-                    possible_lists = [v for v in entries.values() if isinstance(v, list)]
-                    if possible_lists:
-                        entries_list = [item for sublist in possible_lists for item in sublist]
-                    else:
-                        entries_list = []
-            elif isinstance(entries, list):
-                entries_list = entries
-            else:
-                entries_list = []
-
-            # Filter only dicts
-            entries_list = [e for e in entries_list if isinstance(e, dict)]
+            output_path = os.path.join(output_dir, f'diary_{username}.{args.format}')
+            # write next to the target and swap it in only once the whole diary is saved,
+            # so a failure halfway through never replaces a previous good export
+            part_path = output_path + '.part'
 
             # Only keep specified headers and flatten nested fields
-            fieldnames = ["name", "slug", "id", "release", "runtime", "rewatched", "rating", "liked", "reviewed", "date"]
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for entry in entries_list:
-                    actions = entry.get('actions', {}) if isinstance(entry.get('actions', {}), dict) else {}
-                    date_obj = entry.get('date', {}) if isinstance(entry.get('date', {}), dict) else {}
-                    # format date as YYYY-MM-DD if possible
-                    if date_obj and all(k in date_obj and date_obj[k] is not None for k in ('year', 'month', 'day')):
-                        try:
-                            date_str = f"{int(date_obj['year']):04d}-{int(date_obj['month']):02d}-{int(date_obj['day']):02d}"
-                        except Exception:
-                            date_str = str(date_obj)
+            fieldnames = CSV_FIELDNAMES
+            try:
+                if args.format == 'csv':
+                    with open(part_path, "w", newline="", encoding="utf-8", buffering=1024*1024) as f:
+                        # plain writer: rows are already strings in fieldnames order
+                        writer = csv.writer(f)
+                        writer.writerow(fieldnames)
+                        writer.writerows(map(itemgetter(*fieldnames), map(diary_row, entries)))
+                else:
+                    # optional dependency, only needed for columnar output
+                    import pandas as pd
+
+                    # flatten and format whole columns at once; typed columns are kept
+                    df = pd.json_normalize(list(entries))
+                    dates = df.reindex(columns=['date.year', 'date.month', 'date.day'])
+                    dates.columns = ['year', 'month', 'day']
+                    df['date'] = pd.to_datetime(dates, errors='coerce').dt.strftime('%Y-%m-%d').fillna('')
+                    df = df.rename(columns={f'actions.{k}': k for k in ('rewatched', 'rating', 'liked', 'reviewed')})
+                    df = df.reindex(columns=fieldnames)
+                    # nullable ints, otherwise a single missing value turns the column into float64
+                    df = df.astype({'release': 'Int64', 'runtime': 'Int64', 'rating': 'Int64'})
+                    if args.format == 'parquet':
+                        df.to_parquet(part_path, compression='zstd')
                     else:
-                        date_str = str(date_obj) if date_obj else ''
-
-                    row = {
-                        'name': entry.get('name', '') or '',
-                        'slug': entry.get('slug', '') or '',
-                        'id': entry.get('id', '') or '',
-                        'release': entry.get('release', '') or '',
-                        'runtime': entry.get('runtime', '') or '',
-                        'rewatched': actions.get('rewatched', ''),
-                        'rating': actions.get('rating', ''),
-                        'liked': actions.get('liked', ''),
-                        'reviewed': actions.get('reviewed', ''),
-                        'date': date_str,
-                    }
-                    # Ensure all values are simple scalars for CSV
-                    for k, v in row.items():
-                        if isinstance(v, bool):
-                            row[k] = '1' if v else '0'
-                        elif v is None:
-                            row[k] = ''
-                        else:
-                            row[k] = str(v)
-                    writer.writerow(row)
+                        df.to_feather(part_path, compression='lz4')
+                os.replace(part_path, output_path)
+            finally:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
             print(f"✅ Diary saved to: {output_path}")
         else:
             print("⚠️ No entries found.")
     except PrivateRouteError:
         print(f"Error: User's diary is private.")
     except Exception as e:
-        print(f"⚠️ Failed to save diary to CSV: {e}")
-        print(f"⚠️ Failed to save diary to CSV: {e}")
+        print(f"⚠️ Failed to save diary to {args.format.upper()}: {e}")
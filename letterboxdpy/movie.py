@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from json import (
   dumps as json_dumps,
   loads as json_loads,
@@ -17,10 +18,15 @@ class Movie:
 
     class MoviePages:
         def __init__(self, slug: str) -> None:
-            self.profile = movie_profile.MovieProfile(slug)
-            self.details = movie_details.MovieDetails(slug)
+            # profile, details and members fetch their page on init; they don't depend on each other
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                profile = executor.submit(movie_profile.MovieProfile, slug)
+                details = executor.submit(movie_details.MovieDetails, slug)
+                members = executor.submit(movie_members.MovieMembers, slug)
+            self.profile = profile.result()
+            self.details = details.result()
             self.lists = movie_lists.MovieLists(slug)
-            self.members = movie_members.MovieMembers(slug)
+            self.members = members.result()
             self.reviews = movie_reviews.MovieReviews(slug)
             self.similar = movie_similar.MovieSimilar(slug)
 
@@ -42,7 +42,6 @@ class MovieProfile:
 
 def extract_movie_id(dom):
     """Extract movie ID from DOM."""
-    from letterboxdpy.utils.utils_parser import extract_numeric_text
     elem = dom.find('span', 'block-flag-wrapper')
     elem = elem.find('a')
     return extract_numeric_text(elem.get('data-report-url'))
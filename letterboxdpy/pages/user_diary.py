@@ -1,4 +1,7 @@
+import threading
 from datetime import datetime
+from queue import Full, Queue
+from typing import Iterator, Tuple
 from letterboxdpy.core.scraper import parse_url
 from letterboxdpy.constants.project import DOMAIN, CURRENT_YEAR, CURRENT_MONTH, CURRENT_DAY
 
@@ -12,6 +15,9 @@ class UserDiary:
     def get_diary(self, year: int=None, month: int=None, day: int=None, page: int=None) -> dict:
         return extract_user_diary(self.username, year, month, day, page)
 
+    def iter_diary_pages(self, year: int=None, month: int=None, day: int=None, page: int=None) -> Iterator[Tuple[int, dict]]:
+        return iter_user_diary_pages(self.username, year, month, day, page)
+
     def get_year(self, year: int=CURRENT_YEAR) -> dict:
         return extract_user_diary(self.username, year)
 
@@ -24,14 +30,14 @@ class UserDiary:
     def get_wrapped(self, year: int=CURRENT_YEAR) -> dict:
         return extract_user_wrapped(self.username, year)
 
-def extract_user_diary(
+def iter_user_diary_pages(
         username: str,
         year: int=None,
         month: int=None,
         day: int=None,
-        page: int=None) -> dict:
+        page: int=None) -> Iterator[Tuple[int, dict]]:
     """
-    Extracts the user's diary entries, optionally filtering by year, month, and day.
+    Lazily extracts the user's diary one page at a time, optionally filtering by year, month, and day.
 
     Args:
         username (str): The Letterboxd username.
@@ -40,8 +46,9 @@ def extract_user_diary(
         day (int, optional): The day of diary entries.
         page (int, optional): The page number for pagination.
 
-    Returns:
-        dict: A dictionary with diary entries, each containing movie details, rewatch status, rating, like status, review status, and entry date.
+    Yields:
+        tuple: The page number and a dictionary of that page's diary entries keyed by log id.
+               A page without a diary table is yielded empty and ends the iteration.
     """
     
     def extract_movie_name(react_div, default="Unknown"):
@@ -54,111 +61,172 @@ def extract_user_diary(
 
         return raw_name.rsplit(' (', 1)[0] if ' (' in raw_name and raw_name.endswith(')') else raw_name
 
+    def put_page(item) -> None:
+        """Hand an item to the parser unless it has stopped listening."""
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def fetch_pages() -> None:
+        """Fetch diary pages ahead of the parser and flag the last one."""
+        pagination = page if page else 1
+        try:
+            while not stop.is_set():
+                url = BASE_URL + f"page/{pagination}/"
+                dom = parse_url(url)
+                table = dom.find("table", {"id": ["diary-table"], })
+                # no table, no more entries or reached the requested page
+                is_last = not table or len(dom.tbody.find_all("tr")) < 50 or pagination == page
+                put_page((pagination, url, dom, is_last))
+
+                if is_last:
+                    break
+                pagination += 1
+        except Exception as e:
+            put_page(e)
+        finally:
+            put_page(None)
+
     date_filter = f"for/{year}/" if year else ""
     date_filter += f"{str(month).zfill(2)}/" if month else ""
     date_filter += f"{str(day).zfill(2)}/" if day else ""
 
     BASE_URL = f"{DOMAIN}/{username}/films/diary/{date_filter}"
-    pagination = page if page else 1
-    ret = {'entries': {}}
 
-    while True:
-        url = BASE_URL + f"page/{pagination}/"
-
-        dom = parse_url(url)
-        table = dom.find("table", {"id": ["diary-table"], })
-
-        if table:
-            # extract the headers class of the table to use as keys for the entries
-            # ['month','day','film','released','rating','like','rewatch','review', actions']
-            headers = [elem['class'][0].split('-')[-1] for elem in table.find_all("th")]
-            rows = dom.tbody.find_all("tr")
-
-            for row in rows:
-                # create a dictionary by mapping headers class
-                # to corresponding columns in the row
-                cols = dict(zip(headers, row.find_all('td')))
-
-                # <tr class="diary-entry-row .." data-viewing-id="516951060" ..>
-                log_id = row["data-viewing-id"]
-
-                # day column (updated for new HTML structure)
-                if 'daydate' in cols:
-                    date = dict(zip(
-                            ["year", "month", "day"],
-                            map(int, cols['daydate'].a['href'].split('/')[-4:])
-                        ))
-                elif 'day' in cols:  # fallback for old structure
-                    date = dict(zip(
-                            ["year", "month", "day"],
-                            map(int, cols['day'].a['href'].split('/')[-4:])
-                        ))
-                else:
-                    # Extract from monthdate if available
-                    date = {"year": None, "month": None, "day": None}
-                # Extract film data from react-component
-                production_col = cols.get('production')
-                react_div = production_col.find('div', {'class': 'react-component'}) if production_col else None
+    # overlap fetching the next page with parsing the current one
+    pages = Queue(maxsize=2)
+    stop = threading.Event()
+    threading.Thread(target=fetch_pages, daemon=True).start()
+
+    try:
+        while True:
+            item = pages.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            pagination, url, dom, is_last = item
+            table = dom.find("table", {"id": ["diary-table"], })
+            entries = {}
+
+            if table:
+                # extract the headers class of the table to use as keys for the entries
+                # ['month','day','film','released','rating','like','rewatch','review', actions']
+                headers = [elem['class'][0].split('-')[-1] for elem in table.find_all("th")]
+                rows = dom.tbody.find_all("tr")
+
+                for row in rows:
+                    # create a dictionary by mapping headers class
+                    # to corresponding columns in the row
+                    cols = dict(zip(headers, row.find_all('td')))
+
+                    # <tr class="diary-entry-row .." data-viewing-id="516951060" ..>
+                    log_id = row["data-viewing-id"]
+
+                    # day column (updated for new HTML structure)
+                    if 'daydate' in cols:
+                        date = dict(zip(
+                                ["year", "month", "day"],
+                                map(int, cols['daydate'].a['href'].split('/')[-4:])
+                            ))
+                    elif 'day' in cols:  # fallback for old structure
+                        date = dict(zip(
+                                ["year", "month", "day"],
+                                map(int, cols['day'].a['href'].split('/')[-4:])
+                            ))
+                    else:
+                        # Extract from monthdate if available
+                        date = {"year": None, "month": None, "day": None}
+                    # Extract film data from react-component
+                    production_col = cols.get('production')
+                    react_div = production_col.find('div', {'class': 'react-component'}) if production_col else None
                 
-                name = extract_movie_name(react_div)
-                slug = react_div.get("data-item-slug") if react_div else None
-                id = react_div.get("data-film-id") if react_div else None
-                # released column (updated for new HTML structure)
-                if 'releaseyear' in cols:
-                    release = cols["releaseyear"].text.strip()
-                elif 'released' in cols:  # fallback for old structure
-                    release = cols["released"].text.strip()
-                else:
-                    release = ""
-                release = int(release) if len(release) else None
-                # rewatch column
-                rewatched = "icon-status-off" not in cols["rewatch"]["class"]
-                # rating column
-                rating = cols["rating"].span
-                is_rating = 'rated-' in ''.join(rating["class"])
-                rating = int(rating["class"][-1].split("-")[-1]) if is_rating else None
-                # like column
-                liked = bool(cols["like"].find("span", attrs={"class": "icon-liked"}))
-                # review column
-                reviewed = bool(cols["review"].a)
-                # actions column
-                actions = cols["actions"]
-                """
-                id = actions["data-film-id"] # !film col
-                name = actions["data-film-name"] !# film col
-                slug = actions["data-film-slug"] # !film col
-                release = actions["ddata-film-release-year"] # !released col
-                """
-                # runtime from actions (handle missing attribute)
-                runtime = actions.get("data-film-run-time") or actions.get("data-film-runtime")
-                runtime = int(runtime) if runtime else None
-
-                # create entry
-                ret["entries"][log_id] = {
-                    "name": name,
-                    "slug": slug,
-                    "id":  id,
-                    "release": release,
-                    "runtime": runtime,
-                    "actions": {
-                        "rewatched": rewatched,
-                        "rating": rating,
-                        "liked": liked,
-                        "reviewed": reviewed,
-                    },
-                    "date": date,
-                    "page": {
-                        'url': url,
-                        'no': pagination
-                        }
-                }
-            if len(rows) < 50 or pagination == page:
-                    # no more entries
-                    # or reached the requested page
-                    break
-            pagination += 1
-        else: # no table
-            break
+                    name = extract_movie_name(react_div)
+                    slug = react_div.get("data-item-slug") if react_div else None
+                    id = react_div.get("data-film-id") if react_div else None
+                    # released column (updated for new HTML structure)
+                    if 'releaseyear' in cols:
+                        release = cols["releaseyear"].text.strip()
+                    elif 'released' in cols:  # fallback for old structure
+                        release = cols["released"].text.strip()
+                    else:
+                        release = ""
+                    release = int(release) if len(release) else None
+                    # rewatch column
+                    rewatched = "icon-status-off" not in cols["rewatch"]["class"]
+                    # rating column
+                    rating = cols["rating"].span
+                    is_rating = 'rated-' in ''.join(rating["class"])
+                    rating = int(rating["class"][-1].split("-")[-1]) if is_rating else None
+                    # like column
+                    liked = bool(cols["like"].find("span", attrs={"class": "icon-liked"}))
+                    # review column
+                    reviewed = bool(cols["review"].a)
+                    # actions column
+                    actions = cols["actions"]
+                    """
+                    id = actions["data-film-id"] # !film col
+                    name = actions["data-film-name"] !# film col
+                    slug = actions["data-film-slug"] # !film col
+                    release = actions["ddata-film-release-year"] # !released col
+                    """
+                    # runtime from actions (handle missing attribute)
+                    runtime = actions.get("data-film-run-time") or actions.get("data-film-runtime")
+                    runtime = int(runtime) if runtime else None
+
+                    # create entry
+                    entries[log_id] = {
+                        "name": name,
+                        "slug": slug,
+                        "id":  id,
+                        "release": release,
+                        "runtime": runtime,
+                        "actions": {
+                            "rewatched": rewatched,
+                            "rating": rating,
+                            "liked": liked,
+                            "reviewed": reviewed,
+                        },
+                        "date": date,
+                        "page": {
+                            'url': url,
+                            'no': pagination
+                            }
+                    }
+            yield pagination, entries
+            if is_last:
+                break
+    finally:
+        stop.set()
+
+def extract_user_diary(
+        username: str,
+        year: int=None,
+        month: int=None,
+        day: int=None,
+        page: int=None) -> dict:
+    """
+    Extracts the user's diary entries, optionally filtering by year, month, and day.
+
+    Args:
+        username (str): The Letterboxd username.
+        year (int, optional): The year of diary entries.
+        month (int, optional): The month of diary entries.
+        day (int, optional): The day of diary entries.
+        page (int, optional): The page number for pagination.
+
+    Returns:
+        dict: A dictionary with diary entries, each containing movie details, rewatch status, rating, like status, review status, and entry date.
+    """
+    ret = {'entries': {}}
+    pagination = page if page else 1
+
+    for pagination, entries in iter_user_diary_pages(username, year, month, day, page):
+        ret['entries'].update(entries)
 
     ret['count'] = len(ret['entries'])
     ret['last_page'] = pagination
@@ -1,5 +1,12 @@
 from letterboxdpy.core.scraper import parse_url
 from letterboxdpy.constants.project import DOMAIN, GENRES
+from letterboxdpy.utils.utils_string import extract_year_from_movie_name, clean_movie_name
+
+MOVIE_CONTAINER_SELECTORS = [
+    ("li", {"class": "griditem"}),      # Modern React structure
+    ("li", {"class": "poster-container"}),  # Legacy structure
+    ("li", {"class": "posteritem"})     # Liked films structure
+]
 
 
 class UserFilms:
@@ -26,11 +33,14 @@ class UserFilms:
 def extract_user_films(url: str) -> dict:
     """Extracts user films and their details from the given URL"""
     FILMS_PER_PAGE = 12 * 6
+    # layout is stable across the pages of one list, so the selector
+    # that matched a page is tried first on the next one
+    selectors = list(MOVIE_CONTAINER_SELECTORS)
 
     def process_page(page_number: int) -> dict:
         """Fetches and processes a page of user films."""
         dom = parse_url(f"{url}/page/{page_number}/")
-        return extract_movies_from_user_watched(dom)
+        return extract_movies_from_user_watched(dom, selectors=selectors)
 
     def calculate_statistics(movies: dict) -> dict:
         """Calculates film statistics including liked and rating percentages."""
@@ -71,9 +81,12 @@ def extract_user_films(url: str) -> dict:
 
     return movie_list
 
-def extract_movies_from_user_watched(dom, max=12*6) -> dict:
+def extract_movies_from_user_watched(dom, max=12*6, selectors: list=None) -> dict:
     """
     supports user watched films section
+
+    selectors, if given, is a list of container selectors to try in order;
+    the one that matches is moved to its front for the next page.
     """
     def _extract_rating_and_like_status(container):
         """Parse rating and like status from viewing data spans."""
@@ -122,8 +135,6 @@ def extract_movies_from_user_watched(dom, max=12*6) -> dict:
     
     def _get_movie_details(container):
         """Extract complete movie information including rating and like status."""
-        from letterboxdpy.utils.utils_string import extract_year_from_movie_name, clean_movie_name
-        
         react_component = container.find("div", {"class": "react-component"}) or container.div
         if not react_component or 'data-film-id' not in react_component.attrs:
             return None
@@ -146,15 +157,14 @@ def extract_movies_from_user_watched(dom, max=12*6) -> dict:
 
     def _find_movie_containers(dom):
         """Find movie containers using modern structure with legacy fallback."""
-        container_selectors = [
-            ("li", {"class": "griditem"}),      # Modern React structure
-            ("li", {"class": "poster-container"}),  # Legacy structure
-            ("li", {"class": "posteritem"})     # Liked films structure
-        ]
-        
-        for tag, attrs in container_selectors:
-            containers = dom.find_all(tag, attrs)
+        container_selectors = MOVIE_CONTAINER_SELECTORS if selectors is None else selectors
+
+        for selector in container_selectors:
+            containers = dom.find_all(*selector)
             if containers:
+                if selectors is not None and selectors[0] is not selector:
+                    selectors.remove(selector)
+                    selectors.insert(0, selector)
                 return containers
         return []
 
@@ -1,3 +1,5 @@
+import re
+
 from letterboxdpy.constants.project import DOMAIN
 from letterboxdpy.core.scraper import parse_url
 from letterboxdpy.pages.user_films import extract_user_films
@@ -66,7 +68,7 @@ def extract_liked_reviews(url: str) -> dict:
             if not header:
                 raise ValueError(f"Header is missing for review item")
                 
-            film_link = header.find("a", href=lambda x: x and "/film/" in x)
+            film_link = header.select_one('a[href*="/film/"]')
             if not film_link:
                 raise ValueError(f"Film link is missing for review item")
                 
@@ -89,7 +91,6 @@ def extract_liked_reviews(url: str) -> dict:
             # Extract release year
             movie_release = None
             if header:
-                import re
                 header_text = header.get_text()
                 year_match = re.search(r'\b(19|20)\d{2}\b', header_text)
                 if year_match:
@@ -125,7 +126,7 @@ def extract_liked_reviews(url: str) -> dict:
             review_content = ""
             
             if content_elem:
-                spoiler_elem = content_elem.find("p", {"class": lambda x: x and any('spoiler' in str(cls) for cls in x)})
+                spoiler_elem = content_elem.select_one('p[class*="spoiler"]')
                 spoiler = spoiler_elem is not None
                 
                 paragraphs = content_elem.find_all('p')
@@ -219,7 +220,7 @@ def extract_liked_lists(url: str) -> dict:
         value_elem = item.find('span', {'class': 'value'})
         count = int(value_elem.text.strip().split()[0].replace(',', '')) if value_elem else 0
         
-        likes_elem = item.find('a', {'class': lambda x: x and 'icon-like' in x})
+        likes_elem = item.select_one('a[class*="icon-like"]')
         likes = 0
         if likes_elem:
             likes_span = likes_elem.find('span', {'class': 'label'})
@@ -229,7 +230,7 @@ def extract_liked_lists(url: str) -> dict:
                 except ValueError:
                     pass
         
-        comments_elem = item.find('a', {'class': lambda x: x and 'icon-comment' in x})
+        comments_elem = item.select_one('a[class*="icon-comment"]')
         comments = 0
         if comments_elem:
             comments_span = comments_elem.find('span', {'class': 'label'})
@@ -1,8 +1,14 @@
+import re
+
 from letterboxdpy.core.scraper import parse_url
 from letterboxdpy.constants.project import DOMAIN
 from letterboxdpy.core.exceptions import PageFetchError
 from letterboxdpy.avatar import Avatar
 
+# counts may carry thousands separators, e.g. "1,234 followers"
+COUNT_PATTERN = re.compile(r'\d[\d,]*')
+COMMA_STRIP = str.maketrans('', '', ',')
+
 
 class UserNetwork:
 
@@ -73,22 +79,21 @@ def extract_network(username: str, section: str) -> dict:
             following_count = None
             
             if metadata:
-                followers_link = metadata.find('a', href=lambda x: x and 'followers' in x)
+                followers_link = metadata.select_one('a[href*="followers"]')
                 if followers_link:
                     followers_text = followers_link.get_text(strip=True)
                     # Extract number from "5 followers"
-                    import re
-                    followers_match = re.search(r'(\d+)', followers_text)
+                    followers_match = COUNT_PATTERN.search(followers_text)
                     if followers_match:
-                        followers_count = int(followers_match.group(1))
+                        followers_count = int(followers_match.group().translate(COMMA_STRIP))
                 
-                following_link = metadata.find('a', href=lambda x: x and 'following' in x)
+                following_link = metadata.select_one('a[href*="following"]')
                 if following_link:
                     following_text = following_link.get_text(strip=True)
                     # Extract number from "following 6"
-                    following_match = re.search(r'(\d+)', following_text)
+                    following_match = COUNT_PATTERN.search(following_text)
                     if following_match:
-                        following_count = int(following_match.group(1))
+                        following_count = int(following_match.group().translate(COMMA_STRIP))
             
             # Extract stats from other columns
             watched_cell = row.find('td', class_='col-watched')
@@ -97,10 +102,9 @@ def extract_network(username: str, section: str) -> dict:
                 watched_link = watched_cell.find('a')
                 if watched_link:
                     watched_text = watched_link.get_text(strip=True)
-                    import re
-                    watched_match = re.search(r'(\d+)', watched_text)
+                    watched_match = COUNT_PATTERN.search(watched_text)
                     if watched_match:
-                        watched_count = int(watched_match.group(1))
+                        watched_count = int(watched_match.group().translate(COMMA_STRIP))
             
             lists_cell = row.find('td', class_='col-lists')
             lists_count = None
@@ -108,10 +112,9 @@ def extract_network(username: str, section: str) -> dict:
                 lists_link = lists_cell.find('a')
                 if lists_link:
                     lists_text = lists_link.get_text(strip=True)
-                    import re
-                    lists_match = re.search(r'(\d+)', lists_text)
+                    lists_match = COUNT_PATTERN.search(lists_text)
                     if lists_match:
-                        lists_count = int(lists_match.group(1))
+                        lists_count = int(lists_match.group().translate(COMMA_STRIP))
             
             likes_cell = row.find('td', class_='col-likes')
             likes_count = None
@@ -119,10 +122,9 @@ def extract_network(username: str, section: str) -> dict:
                 likes_link = likes_cell.find('a')
                 if likes_link:
                     likes_text = likes_link.get_text(strip=True)
-                    import re
-                    likes_match = re.search(r'(\d+)', likes_text)
+                    likes_match = COUNT_PATTERN.search(likes_text)
                     if likes_match:
-                        likes_count = int(likes_match.group(1))
+                        likes_count = int(likes_match.group().translate(COMMA_STRIP))
             
             persons_dict[username] = {
                 'username': username,
@@ -6,6 +6,7 @@ from letterboxdpy.utils.utils_parser import get_meta_content, get_body_content
 from letterboxdpy.core.scraper import parse_url
 from letterboxdpy.avatar import Avatar
 from letterboxdpy.constants.project import DOMAIN
+from letterboxdpy.utils.utils_string import extract_year_from_movie_name, clean_movie_name
 
 
 class UserProfile:
@@ -214,8 +215,6 @@ def extract_watchlist_recent(dom) -> dict:
     """Extracts recent watchlist items from the DOM, with error handling."""
     def extract_movie_info(item) -> dict:
         """Extracts movie information from a watchlist item."""
-        from letterboxdpy.utils.utils_string import extract_year_from_movie_name, clean_movie_name
-        
         # Look for data attributes in the nested react-component div
         react_div = item.find('div', {'class': 'react-component'})
         
@@ -1,6 +1,7 @@
 from letterboxdpy.core.scraper import parse_url
 from letterboxdpy.constants.project import DOMAIN
 from letterboxdpy.pages.user_list import extract_movies
+from letterboxdpy.utils.utils_string import extract_year_from_movie_name, clean_movie_name
 
 class UserWatchlist:
     FILMS_PER_PAGE = 7*4
@@ -81,8 +82,6 @@ def extract_watchlist(username: str, filters: dict = None) -> dict:
             Input: container with "The Matrix (1999)"
             Output: {"id": "12345", "slug": "the-matrix", "name": "The Matrix", "year": 1999}
         """
-        from letterboxdpy.utils.utils_string import extract_year_from_movie_name, clean_movie_name
-        
         data = container.find("div", {"class": "react-component"}) or container.div
         if not data or 'data-film-id' not in data.attrs:
             return None
@@ -139,7 +139,7 @@ class Search:
           else:
             # Check if <li> contains child with specific class (e.g., div.film-poster)
             keys = result_types[r_type][1][-1]
-            child_elem = item.find(attrs={"class": lambda x: x and keys in x})
+            child_elem = item.select_one(f'[class*="{keys}"]')
             if child_elem:
               item_type = r_type
               break
@@ -269,7 +269,7 @@ class Search:
           """
           # Review parsing - reviews show the film being reviewed
           # Get film info from the film-poster
-          film_poster = result.find("div", {"class": lambda x: x and "film-poster" in x})
+          film_poster = result.select_one('div[class*="film-poster"]')
           if film_poster:
             slug = film_poster.get('data-film-slug')
             name = film_poster.img.get('alt') if film_poster.img else None
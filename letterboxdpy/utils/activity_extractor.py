@@ -93,7 +93,7 @@ def get_film_info(section, item_slug: str = None) -> dict:
         film_data['title'] = h2.get_text().strip()
         
         # Extract year
-        year_link = section.find("a", href=lambda x: x and "/films/year/" in str(x))
+        year_link = section.select_one('a[href*="/films/year/"]')
         if year_link:
             try:
                 film_data['year'] = int(year_link.get_text().strip())
@@ -212,14 +212,14 @@ def get_list_info(section) -> dict:
     
     if reactions:
         # Extract like count
-        like_link = reactions.find("a", {"class": lambda x: x and "inlineicon" in x and "icon-like" in x if x else False})
+        like_link = reactions.select_one('a[class*="inlineicon"][class*="icon-like"]')
         if like_link:
             like_count = like_link.find("span", {"class": "label"})
             if like_count:
                 info['likes'] = like_count.get_text().strip()
         
         # Extract comment count
-        comment_link = reactions.find("a", {"class": lambda x: x and "inlineicon" in x and "icon-comment" in x if x else False})
+        comment_link = reactions.select_one('a[class*="inlineicon"][class*="icon-comment"]')
         if comment_link:
             comment_count = comment_link.find("span", {"class": "label"})
             if comment_count:
@@ -5,6 +5,8 @@ This module provides generic functions to extract movie data from various
 Letterboxd page types that display movies in different layouts.
 """
 
+from letterboxdpy.utils.utils_string import extract_year_from_movie_name, clean_movie_name
+
 def extract_movies_from_horizontal_list(dom, max_items=12*6) -> dict:
     """
     Extract movies from horizontal movie lists.
@@ -63,8 +65,6 @@ def extract_movies_from_vertical_list(dom, max_items=20*5) -> dict:
     """
     def get_movie_data(item):
         """Extract movie ID, slug, and name from container element."""
-        from letterboxdpy.utils.utils_string import extract_year_from_movie_name, clean_movie_name
-        
         react_component = item.find("div", {"class": "react-component"}) if item.name == "li" else item
         if not react_component or 'data-film-id' not in react_component.attrs:
             return None
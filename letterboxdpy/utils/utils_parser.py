@@ -6,6 +6,7 @@ from letterboxdpy.utils.utils_transform import month_to_index
 from letterboxdpy.constants.project import DOMAIN_SHORT
 from letterboxdpy.constants.selectors import PageSelectors
 
+NON_DIGIT_PATTERN = re.compile(r"[^0-9]")
 
 def try_parse(value, target_type):
     """Attempt to convert the given value to the specified target type."""
@@ -33,7 +34,7 @@ def extract_numeric_text(text: str) -> Optional[int]:
     Returns None if an error occurs.
     """
     try:
-        numeric_value = int(re.sub(r"[^0-9]", '', text))
+        numeric_value = int(NON_DIGIT_PATTERN.sub('', text))
         return numeric_value
     except ValueError:
         return None
@@ -167,7 +168,7 @@ def get_list_short_url(dom, domain=DOMAIN_SHORT, default=None) -> str:
     """
     try:
         # Find input field containing short URL
-        input_field = dom.find('input', type='text', value=lambda x: x and domain in x)
+        input_field = dom.select_one(f'input[type="text"][value*="{domain}"]')
         if input_field:
             return input_field.get('value')
         return default
@@ -0,0 +1,136 @@
+from letterboxdpy.diary import CSV_FIELDNAMES, diary_row
+from letterboxdpy.pages import user_diary
+from letterboxdpy.core.exceptions import PrivateRouteError
+from bs4 import BeautifulSoup
+from types import SimpleNamespace
+from unittest.mock import patch
+import threading
+import unittest
+
+HEADERS = ['daydate', 'production', 'releaseyear', 'rating', 'like', 'rewatch', 'review', 'actions']
+ROW = (
+    '<tr data-viewing-id="{id}">'
+    '<td class="td-daydate"><a href="/u/films/diary/for/2024/03/01/">1</a></td>'
+    '<td class="td-production"><div class="react-component" data-item-name="Film {id} (2001)"'
+    ' data-item-slug="film-{id}" data-film-id="{id}"></div></td>'
+    '<td class="td-releaseyear">2001</td>'
+    '<td class="td-rating"><span class="rating rated-4"></span></td>'
+    '<td class="td-like"></td><td class="td-rewatch icon-status-off"></td>'
+    '<td class="td-review"></td><td class="td-actions"></td></tr>'
+)
+
+
+class TestUserDiary(unittest.TestCase):
+    """Offline tests for the prefetching diary pagination, parse_url is stubbed."""
+
+    def fake_site(self, page_sizes):
+        """Return a parse_url stub serving diary pages with the given row counts."""
+        self.requested = []
+
+        def parse_url(url):
+            self.requested.append(url)
+            page = int(url.rstrip('/').split('/')[-1])
+            if page > len(page_sizes):
+                return BeautifulSoup('<p>No diary entries</p>', 'lxml')
+            rows = ''.join(ROW.format(id=page * 100 + i) for i in range(page_sizes[page - 1]))
+            header = ''.join(f'<th class="td-{h}"></th>' for h in HEADERS)
+            html = f'<table id="diary-table"><thead><tr>{header}</tr></thead><tbody>{rows}</tbody></table>'
+            return BeautifulSoup(html, 'lxml')
+        return parse_url
+
+    def extract(self, page_sizes, page=None):
+        with patch.object(user_diary, 'parse_url', self.fake_site(page_sizes)):
+            return user_diary.extract_user_diary('u', page=page)
+
+    def test_multiple_pages(self):
+        diary = self.extract([50, 50, 3])
+        self.assertEqual(diary['count'], 103)
+        self.assertEqual(diary['last_page'], 3)
+        self.assertEqual(len(self.requested), 3)
+
+    def test_exact_multiple_of_page_size(self):
+        diary = self.extract([50, 50])
+        self.assertEqual(diary['count'], 100)
+        self.assertEqual(diary['last_page'], 3)
+        self.assertEqual(len(self.requested), 3)
+
+    def test_requested_page(self):
+        diary = self.extract([50, 50, 3], page=2)
+        self.assertEqual(diary['count'], 50)
+        self.assertEqual(diary['last_page'], 2)
+        self.assertEqual(len(self.requested), 1)
+
+    def test_empty_diary(self):
+        diary = self.extract([])
+        self.assertEqual(diary['count'], 0)
+        self.assertEqual(diary['last_page'], 1)
+
+    def test_fetch_error_is_raised(self):
+        def parse_url(url):
+            raise PrivateRouteError('private')
+
+        with patch.object(user_diary, 'parse_url', parse_url):
+            with self.assertRaises(PrivateRouteError):
+                user_diary.extract_user_diary('u')
+
+    def test_close_stops_prefetching(self):
+        fetchers = []
+
+        def record_thread(*args, **kwargs):
+            fetchers.append(threading.Thread(*args, **kwargs))
+            return fetchers[-1]
+
+        fake_threading = SimpleNamespace(Thread=record_thread, Event=threading.Event)
+        with patch.object(user_diary, 'parse_url', self.fake_site([50] * 20)), \
+                patch.object(user_diary, 'threading', fake_threading):
+            pages = user_diary.iter_user_diary_pages('u')
+            pagination, entries = next(pages)
+            pages.close()
+            fetchers[0].join(timeout=5)
+
+        self.assertFalse(fetchers[0].is_alive())
+        self.assertEqual(pagination, 1)
+        self.assertEqual(len(entries), 50)
+        # the queue holds two pages, so the fetcher stops a few pages ahead at most
+        self.assertLessEqual(len(self.requested), 5)
+
+
+class TestDiaryRow(unittest.TestCase):
+    """The CSV export must keep the columns and cell format of the original script."""
+
+    def test_column_order(self):
+        self.assertEqual(CSV_FIELDNAMES, [
+            "name", "slug", "id", "release", "runtime",
+            "rewatched", "rating", "liked", "reviewed", "date"
+        ])
+
+    def test_full_entry(self):
+        entry = {
+            "name": "Dune: Part Two", "slug": "dune-part-two", "id": "617443",
+            "release": 2024, "runtime": 167,
+            "actions": {"rewatched": True, "rating": 9, "liked": False, "reviewed": True},
+            "date": {"year": 2024, "month": 3, "day": 1},
+        }
+        row = diary_row(entry)
+        self.assertEqual([row[field] for field in CSV_FIELDNAMES], [
+            "Dune: Part Two", "dune-part-two", "617443", "2024", "167",
+            "1", "9", "0", "1", "2024-03-01"
+        ])
+
+    def test_missing_values(self):
+        entry = {
+            "name": "Unknown", "slug": None, "id": None, "release": None, "runtime": None,
+            "actions": {"rewatched": False, "rating": None},
+            "date": None,
+        }
+        row = diary_row(entry)
+        self.assertEqual([row[field] for field in CSV_FIELDNAMES], [
+            "Unknown", "", "", "", "", "0", "", "", "", ""
+        ])
+
+    def test_incomplete_date(self):
+        row = diary_row({"date": {"year": None, "month": None, "day": None}})
+        self.assertEqual(row["date"], "{'year': None, 'month': None, 'day': None}")
+
+if __name__ == '__main__':
+    unittest.main()
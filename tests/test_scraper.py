@@ -1,8 +1,27 @@
 from letterboxdpy.core.scraper import Scraper, url_encode
+from letterboxdpy.core.exceptions import InvalidResponseError
 from bs4 import BeautifulSoup
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import Mock, patch
+import threading
 import unittest
 
 
+class RateLimitedHandler(BaseHTTPRequestHandler):
+    """Answers every request with a 429 and a Retry-After of 3 seconds."""
+    requests_seen = 0
+
+    def do_GET(self):
+        type(self).requests_seen += 1
+        self.send_response(429)
+        self.send_header('Retry-After', '3')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
 class TestScraper(unittest.TestCase):
 
     def setUp(self):
@@ -25,5 +44,44 @@ class TestScraper(unittest.TestCase):
         encoded_query = url_encode(query)
         self.assertEqual(encoded_query, "Dune%3A%20Part%20Two")
 
+    @patch('letterboxdpy.core.scraper.time.sleep')
+    @patch('letterboxdpy.core.scraper.time.monotonic', return_value=100.0)
+    def test_throttle_spacing(self, _, mock_sleep):
+        Scraper._next_request_at = 0.0
+        for _ in range(3):
+            Scraper._throttle()
+
+        interval = 1 / Scraper.max_requests_per_second
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(waits), 2)  # first request goes out immediately
+        self.assertAlmostEqual(waits[0], interval)
+        self.assertAlmostEqual(waits[1], 2 * interval)
+        Scraper._next_request_at = 0.0
+
+    @patch('letterboxdpy.core.scraper.time.sleep')
+    def test_rate_limit_retries_after_header(self, mock_sleep):
+        limited = Mock(status_code=429, headers={'Retry-After': '2'})
+        ok = Mock(status_code=200, headers={})
+        with patch.object(Scraper.session, 'get', side_effect=[limited, ok]):
+            self.assertIs(Scraper._fetch(self.valid_film_url), ok)
+        mock_sleep.assert_any_call(2.0)
+
+    @patch.object(Scraper, 'retry_after_max', 1)
+    def test_rate_limit_retry_after_too_long(self):
+        # goes through the mounted adapter, so its urllib3 retries are exercised too
+        server = HTTPServer(('127.0.0.1', 0), RateLimitedHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/"
+        RateLimitedHandler.requests_seen = 0
+        Scraper.session.mount(url, Scraper.session.get_adapter("https://letterboxd.com/"))
+        try:
+            with self.assertRaises(InvalidResponseError):
+                Scraper.get_page(url)
+        finally:
+            del Scraper.session.adapters[url]
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(RateLimitedHandler.requests_seen, 1)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+from letterboxdpy.pages import user_network
+from bs4 import BeautifulSoup
+from unittest.mock import patch
+import unittest
+
+ROW = (
+    '<tr><td class="col-member"><div class="person-summary">'
+    '<a class="avatar" href="/{username}/"><img alt="{username}" src="https://a.ltrbxd.com/avatar-0-80-0-80.jpg"></a>'
+    '<a class="name" href="/{username}/">{name}</a>'
+    '<small class="metadata">'
+    '<a href="/{username}/followers/">{followers} followers</a>, '
+    '<a href="/{username}/following/">following {following}</a>'
+    '</small></div></td>'
+    '<td class="col-watched"><a href="/{username}/films/">{watched}</a></td>'
+    '<td class="col-lists"><a href="/{username}/lists/">{lists}</a></td>'
+    '<td class="col-likes"><a href="/{username}/likes/">{likes}</a></td></tr>'
+)
+
+
+class TestUserNetwork(unittest.TestCase):
+    """Offline tests for network row parsing, parse_url is stubbed."""
+
+    def setUp(self):
+        rows = ROW.format(
+            username='popular', name='Popular User',
+            followers='12,345', following='1,002', watched='3,456', lists='12', likes='1,234,567'
+        ) + ROW.format(
+            username='casual', name='Casual User',
+            followers='5', following='6', watched='78', lists='0', likes='9'
+        )
+        dom = BeautifulSoup(f'<table class="member-table"><tbody>{rows}</tbody></table>', 'lxml')
+        with patch.object(user_network, 'parse_url', return_value=dom):
+            self.network = user_network.extract_network('someone', 'followers')
+
+    def test_comma_separated_counts(self):
+        person = self.network['popular']
+        self.assertEqual(person['name'], 'Popular User')
+        self.assertEqual(person['followers'], 12345)
+        self.assertEqual(person['following'], 1002)
+        self.assertEqual(person['watched'], 3456)
+        self.assertEqual(person['lists'], 12)
+        self.assertEqual(person['likes'], 1234567)
+
+    def test_plain_counts(self):
+        person = self.network['casual']
+        self.assertEqual(person['followers'], 5)
+        self.assertEqual(person['following'], 6)
+        self.assertEqual(person['watched'], 78)
+        self.assertEqual(person['lists'], 0)
+        self.assertEqual(person['likes'], 9)
+
+    def test_row_details(self):
+        self.assertEqual(list(self.network), ['popular', 'casual'])
+        person = self.network['casual']
+        self.assertEqual(person['url'], 'https://letterboxd.com/casual')
+        self.assertTrue(person['avatar']['upscaled'])
+
+if __name__ == '__main__':
+    unittest.main()